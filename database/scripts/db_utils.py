@@ -0,0 +1,38 @@
+"""
+KaizenMCP Database Script Utilities
+
+Shared helpers for the migration scripts.
+"""
+import os
+
+
+def batch_sql_steps(migrations):
+    """Collapse each raw SQL migration into a single step.
+
+    Yoyo splits SQL files into individual statements and sends them one by one.
+    Submitting the whole file as one step keeps the migration transactional
+    while saving a round trip per statement.
+    """
+    # StepCollector and Migration.source are yoyo internals; if a future release
+    # changes them, keep yoyo's own statement-by-statement steps
+    try:
+        from yoyo.migrations import StepCollector
+    except ImportError:
+        return migrations
+
+    for migration in migrations:
+        if not migration.is_raw_sql():
+            continue
+        if os.path.exists(os.path.splitext(migration.path)[0] + '.rollback.sql'):
+            continue
+
+        migration.load()
+        try:
+            collector = StepCollector(migration=migration)
+            collector.add_step(migration.source)
+            steps = collector.create_steps(migration.use_transactions)
+        except (AttributeError, TypeError):
+            continue
+        migration.steps = steps
+
+    return migrations
@@ -6,19 +6,35 @@ Loads sample data files into the database for development and testing.
 """
 import os
 import sys
-import glob
-import psycopg2
 from pathlib import Path
 
 
+# Statement-level triggers that refresh mv_active_knowledge_search after every
+# INSERT. Sample files issue many INSERT statements, so the view is refreshed
+# once at the end of the load instead of once per statement.
+DEFERRED_REFRESH_TRIGGERS = [
+    ('knowledge', 'trigger_refresh_active_knowledge'),
+    ('knowledge_conflicts', 'trigger_refresh_active_knowledge_conflict'),
+]
+
+
 def execute_sql_file(database_url, sql_file_path):
-    """Execute SQL file against the database."""
+    """Execute SQL file against the database in a single transaction."""
+    import psycopg2
+
+    with open(sql_file_path, 'r') as f:
+        sql_content = f.read()
+
     with psycopg2.connect(database_url) as conn:
         with conn.cursor() as cur:
-            with open(sql_file_path, 'r') as f:
-                sql_content = f.read()
-            
+            for table, trigger in DEFERRED_REFRESH_TRIGGERS:
+                cur.execute(f"ALTER TABLE {table} DISABLE TRIGGER {trigger}")
+
             cur.execute(sql_content)
+
+            for table, trigger in DEFERRED_REFRESH_TRIGGERS:
+                cur.execute(f"ALTER TABLE {table} ENABLE TRIGGER {trigger}")
+            cur.execute("REFRESH MATERIALIZED VIEW mv_active_knowledge_search")
         conn.commit()
         print(f"✓ Executed {sql_file_path}")
 
@@ -32,12 +48,16 @@ def main():
     
     # Find a matching sample file
     sample_data_dir = Path(__file__).parent.parent / 'sql' / 'sample-data'
-    pattern = str(sample_data_dir / f'{sample_num}_*.sql')
-    sample_files = glob.glob(pattern)
+    prefix = f'{sample_num}_'
+    with os.scandir(sample_data_dir) as entries:
+        sample_files = [
+            entry.path for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith('.sql') and entry.is_file()
+        ]
     
     if not sample_files:
         print(f"✗ No sample file found for number {sample_num}")
-        print(f"Looking for pattern: {pattern}")
+        print(f"Looking for pattern: {sample_data_dir / f'{prefix}*.sql'}")
         sys.exit(1)
     
     if len(sample_files) > 1:
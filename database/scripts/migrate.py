@@ -8,8 +8,6 @@ import os
 import sys
 from pathlib import Path
 
-from yoyo import get_backend, read_migrations
-
 
 def main():
     """Apply all pending migrations."""
@@ -17,8 +15,12 @@ def main():
     migrations_dir = Path(__file__).parent.parent / 'sql' / 'migrations'
 
     try:
+        from yoyo import get_backend, read_migrations
+
+        from db_utils import batch_sql_steps
+
         backend = get_backend(database_url)
-        migrations = read_migrations(str(migrations_dir))
+        migrations = batch_sql_steps(read_migrations(str(migrations_dir)))
 
         with backend.lock():
             backend.apply_migrations(backend.to_apply(migrations))
@@ -8,8 +8,6 @@ import os
 import sys
 from pathlib import Path
 
-from yoyo import get_backend, read_migrations
-
 
 def main():
     """Show migration status."""
@@ -17,6 +15,8 @@ def main():
     migrations_dir = Path(__file__).parent.parent / 'sql' / 'migrations'
 
     try:
+        from yoyo import get_backend, read_migrations
+
         backend = get_backend(database_url)
         migrations = read_migrations(str(migrations_dir))
 
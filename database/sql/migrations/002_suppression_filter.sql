@@ -0,0 +1,39 @@
+-- KaizenMCP Suppression Filter Migration
+-- depends: 001_initial_schema
+
+-- Rebuild the active knowledge view with a containment-based suppression filter.
+-- "k.id = ANY(kc.suppressed_knowledge_ids)" cannot use idx_conflicts_suppressed,
+-- so every refresh scanned all conflicts per knowledge row; "@>" is served by the GIN index.
+
+DROP MATERIALIZED VIEW IF EXISTS mv_active_knowledge_search;
+
+CREATE MATERIALIZED VIEW mv_active_knowledge_search AS
+SELECT 
+    k.id,
+    k.scope_id,
+    k.content,
+    k.context,
+    k.task_size,
+    k.search_vector,
+    s.name as scope_name,
+    n.name as namespace_name,
+    n.name || ':' || s.name as qualified_scope_name
+FROM knowledge k
+JOIN scopes s ON k.scope_id = s.id
+JOIN namespaces n ON s.namespace_id = n.id
+WHERE NOT EXISTS (
+    SELECT 1 FROM knowledge_conflicts kc 
+    WHERE kc.suppressed_knowledge_ids @> ARRAY[k.id]
+);
+
+CREATE UNIQUE INDEX idx_mv_active_knowledge_id ON mv_active_knowledge_search (id);
+CREATE INDEX idx_mv_active_search_gin ON mv_active_knowledge_search USING GIN (search_vector);
+CREATE INDEX idx_mv_active_scope_task ON mv_active_knowledge_search (scope_id, task_size);
+CREATE INDEX idx_mv_active_qualified_scope ON mv_active_knowledge_search (qualified_scope_name);
+
+ALTER MATERIALIZED VIEW mv_active_knowledge_search SET (
+    autovacuum_enabled = true,
+    autovacuum_vacuum_scale_factor = 0.1
+);
+
+COMMENT ON MATERIALIZED VIEW mv_active_knowledge_search IS 'Pre-joined, conflict-filtered knowledge for fast search';
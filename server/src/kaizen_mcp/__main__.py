@@ -7,27 +7,32 @@ from pathlib import Path
 # Enable running as a script (python src/kaizen_mcp/__main__.py) for development.
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from kaizen_mcp import database
 from kaizen_mcp.config import Config, create_parser
-from kaizen_mcp.server import mcp
 
 
 async def run_server(config: Config) -> None:
     """Initialize the database and run the MCP server."""
+    # Deferred so that argument parsing and --help do not pay for importing fastmcp and asyncpg
+    from kaizen_mcp import database
+    from kaizen_mcp.server import mcp
+
+    # Pool connections are created on the same loop that serves requests, and released when it stops
     await database.initialize(config)
-    
-    # Run MCP server based on transport
-    if config.transport == "http":
-        print(f"Starting HTTP server on {config.http_host}:{config.http_port}{config.http_path}", file=sys.stderr)
-        await mcp.run_http_async(
-            host=config.http_host,
-            port=config.http_port,
-            path=config.http_path,
-            stateless_http=True
-        )
-    else:
-        print("Starting STDIO server", file=sys.stderr)
-        await mcp.run_stdio_async()
+    try:
+        # Run MCP server based on transport
+        if config.transport == "http":
+            print(f"Starting HTTP server on {config.http_host}:{config.http_port}{config.http_path}", file=sys.stderr)
+            await mcp.run_http_async(
+                host=config.http_host,
+                port=config.http_port,
+                path=config.http_path,
+                stateless_http=True
+            )
+        else:
+            print("Starting STDIO server", file=sys.stderr)
+            await mcp.run_stdio_async()
+    finally:
+        await database.close()
 
 
 def main() -> None:
@@ -45,6 +50,16 @@ def main() -> None:
     print(f"Database: {config.database_url.split('@')[-1] if '@' in config.database_url else 'local'}", file=sys.stderr)
     print("", file=sys.stderr)
 
+    # asyncpg runs noticeably faster on uvloop; use it when the "uvloop" extra is installed
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            uvloop.run(run_server(config))
+            return
+
     asyncio.run(run_server(config))
 
 
@@ -1,7 +1,12 @@
 """Database operations for KaizenMCP Server."""
 
+import asyncio
+import functools
 import sys
-from typing import Any
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any, ParamSpec, TypeVar
 
 import asyncpg
 
@@ -9,25 +14,69 @@ from kaizen_mcp.config import Config
 from kaizen_mcp.utils import parse_canonical_scope_name
 
 _pool: asyncpg.Pool | None = None
+# Bounded wait for a pooled connection, so requests fail instead of queueing forever on an exhausted pool
+_acquire_timeout: float | None = None
 
+# Short-lived in-process cache for namespace listings, cleared by every namespace/scope mutation.
+# Invalidation only reaches this process: mutations made through another server process (e.g. a
+# second stdio client) can take up to NAMESPACES_CACHE_TTL seconds to show up here.
+NAMESPACES_CACHE_TTL = 5.0
+NAMESPACES_CACHE_MAX_ENTRIES = 256
+# (namespace, namespace description, scope, scope description, parents) rows, kept immutable
+_NamespaceRow = tuple[str, str, str | None, str | None, tuple[str, ...]]
+_namespaces_cache: dict[str | None, tuple[float, tuple[_NamespaceRow, ...]]] = {}
+_namespaces_cache_generation = 0
 
-async def get_pool() -> asyncpg.Pool:
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def get_pool() -> asyncpg.Pool:
     """Get the database connection pool."""
     if _pool is None:
         raise RuntimeError("Database pool not initialized. Call initialize() first.")
     return _pool
 
 
+class PoolExhaustedError(RuntimeError):
+    """Raised when no connection can be acquired within the acquire timeout.
+
+    The pool may be exhausted, or opening a new connection may be slow or failing.
+    """
+
+
+@asynccontextmanager
+async def _acquire() -> AsyncIterator[asyncpg.Connection]:
+    """Acquire a pooled connection, waiting at most the configured acquire timeout."""
+    pool = get_pool()
+    try:
+        conn = await pool.acquire(timeout=_acquire_timeout)
+    except asyncio.TimeoutError:
+        raise PoolExhaustedError(
+            f"No database connection available within {_acquire_timeout}s"
+        ) from None
+
+    try:
+        yield conn
+    finally:
+        await pool.release(conn)
+
+
 async def initialize(config: Config) -> None:
     """Initialize the database connection pool."""
-    global _pool
+    global _pool, _acquire_timeout
     
+    _acquire_timeout = config.database_pool_acquire_timeout
     try:
         _pool = await asyncpg.create_pool(
             config.database_url,
             min_size=config.database_pool_min,
             max_size=config.database_pool_max,
+            max_inactive_connection_lifetime=config.database_pool_max_inactive_lifetime,
+            max_queries=config.database_pool_max_queries,
             command_timeout=60,
+            # Short OLTP queries never benefit from JIT compilation, which only adds planning latency
+            server_settings={"jit": "off", "application_name": "kaizen-mcp"},
         )
         print("✓ Database connected", file=sys.stderr)
     except Exception as e:
@@ -35,28 +84,51 @@ async def initialize(config: Config) -> None:
         sys.exit(1)
 
 
+async def close() -> None:
+    """Close the database connection pool, waiting for in-flight queries to finish."""
+    global _pool
+
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+def _invalidates_namespaces_cache(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    """Clear the namespace listing cache once the wrapped operation has finished."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        global _namespaces_cache_generation
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _namespaces_cache_generation += 1
+            _namespaces_cache.clear()
+
+    return wrapper
+
+
 # ============================================================================
 # Namespace operations
 # ============================================================================
 
 
+@_invalidates_namespaces_cache
 async def create_namespace(namespace_name: str, description: str) -> dict[str, Any]:
     """Create namespace with automatic default scope."""
-    pool = await get_pool()
-
-    async with pool.acquire() as conn:
-        async with conn.transaction():
-            await conn.execute(
-                "INSERT INTO namespaces (name, description) VALUES ($1, $2)",
-                namespace_name,
-                description,
-            )
+    async with _acquire() as conn:
+        # Single statement: the default scope is created by trigger within the same implicit transaction
+        await conn.execute(
+            "INSERT INTO namespaces (name, description) VALUES ($1, $2)",
+            namespace_name,
+            description,
+        )
 
-            return {
-                "namespace": namespace_name,
-                "description": description,
-                "default_scope": f"{namespace_name}:default",
-            }
+        return {
+            "namespace": namespace_name,
+            "description": description,
+            "default_scope": f"{namespace_name}:default",
+        }
 
 
 async def list_namespaces() -> dict[str, Any]:
@@ -77,87 +149,99 @@ async def get_namespace_details(namespace_name: str) -> dict[str, Any]:
     return {"namespace": namespace_name, "description": ns_data["description"], "scopes": canonical_scopes}
 
 
+@_invalidates_namespaces_cache
 async def rename_namespace(old_namespace_name: str, new_namespace_name: str) -> dict[str, Any]:
     """Rename a namespace (all references auto-updated via cascade)."""
     if old_namespace_name == "global":
         raise ValueError("Cannot rename the global namespace")
     
-    pool = await get_pool()
-
-    async with pool.acquire() as conn:
-        async with conn.transaction():
-            result = await conn.fetchrow(
-                """UPDATE namespaces 
-                   SET name = $2, updated_at = NOW()
-                   WHERE name = $1
-                   RETURNING description""",
-                old_namespace_name,
-                new_namespace_name,
-            )
+    async with _acquire() as conn:
+        result = await conn.fetchrow(
+            """UPDATE namespaces 
+               SET name = $2, updated_at = NOW()
+               WHERE name = $1
+               RETURNING description""",
+            old_namespace_name,
+            new_namespace_name,
+        )
 
-            if not result:
-                raise ValueError(f"Namespace '{old_namespace_name}' not found")
+        if not result:
+            raise ValueError(f"Namespace '{old_namespace_name}' not found")
 
-            return {
-                "namespace": new_namespace_name,
-                "description": result["description"],
-                "previous_name": old_namespace_name,
-            }
+        return {
+            "namespace": new_namespace_name,
+            "description": result["description"],
+            "previous_name": old_namespace_name,
+        }
 
 
+@_invalidates_namespaces_cache
 async def update_namespace_description(namespace_name: str, new_description: str) -> dict[str, Any]:
     """Update namespace description only."""
     if namespace_name == "global":
         raise ValueError("Cannot modify the global namespace description")
     
-    pool = await get_pool()
-
-    async with pool.acquire() as conn:
-        result = await conn.fetchrow(
-            """UPDATE namespaces 
-               SET description = $2, updated_at = NOW()
-               WHERE name = $1
-               RETURNING name""",
+    async with _acquire() as conn:
+        # Skip the write (and updated_at bump) when the description is unchanged
+        namespace_exists = await conn.fetchval(
+            """
+            WITH target AS (
+                SELECT id, description FROM namespaces WHERE name = $1
+            ),
+            updated AS (
+                UPDATE namespaces 
+                SET description = $2, updated_at = NOW()
+                FROM target
+                WHERE namespaces.id = target.id
+                  AND target.description IS DISTINCT FROM $2
+            )
+            SELECT EXISTS(SELECT 1 FROM target)
+        """,
             namespace_name,
             new_description,
         )
 
-        if not result:
+        if not namespace_exists:
             raise ValueError(f"Namespace '{namespace_name}' not found")
 
         return {"namespace": namespace_name, "description": new_description}
 
 
+@_invalidates_namespaces_cache
 async def delete_namespace(namespace_name: str) -> dict[str, Any]:
     """Delete namespace and ALL associated data (cannot be undone)."""
-    pool = await get_pool()
-
-    async with pool.acquire() as conn:
-        async with conn.transaction():
-            stats = await conn.fetchrow(
-                """
+    async with _acquire() as conn:
+        # Count and delete in a single statement; no row means the namespace does not exist
+        stats = await conn.fetchrow(
+            """
+            WITH target AS (
                 SELECT 
-                    COUNT(DISTINCT s.id) as scopes_count,
-                    COUNT(DISTINCT k.id) as knowledge_count
+                    n.id,
+                    (SELECT COUNT(*) FROM scopes s WHERE s.namespace_id = n.id) as scopes_count,
+                    (SELECT COUNT(*) FROM knowledge k
+                     JOIN scopes s ON k.scope_id = s.id
+                     WHERE s.namespace_id = n.id) as knowledge_count
                 FROM namespaces n
-                LEFT JOIN scopes s ON n.id = s.namespace_id
-                LEFT JOIN knowledge k ON s.id = k.scope_id
                 WHERE n.name = $1
-                GROUP BY n.id
-            """,
-                namespace_name,
+            ),
+            deleted AS (
+                DELETE FROM namespaces WHERE id IN (SELECT id FROM target) RETURNING id
             )
+            SELECT target.scopes_count, target.knowledge_count
+            FROM target
+            JOIN deleted ON deleted.id = target.id
+        """,
+            namespace_name,
+        )
 
-            if not stats:
-                raise ValueError(f"Namespace '{namespace_name}' not found")
-
-            await conn.execute("DELETE FROM namespaces WHERE name = $1", namespace_name)
+        if not stats:
+            raise ValueError(f"Namespace '{namespace_name}' not found")
 
-            return {
-                "namespace": namespace_name,
-                "deleted_scopes": stats["scopes_count"] or 0,
-                "deleted_knowledge": stats["knowledge_count"] or 0,
-            }
+        return {
+            "namespace": namespace_name,
+            "deleted_scopes": stats["scopes_count"] or 0,
+            "deleted_knowledge": stats["knowledge_count"] or 0,
+        }
 
 
 # ============================================================================
@@ -165,26 +249,26 @@ async def delete_namespace(namespace_name: str) -> dict[str, Any]:
 # ============================================================================
 
 
+@_invalidates_namespaces_cache
 async def create_scope(canonical_scope_name: str, description: str, parents: list[str]) -> dict[str, Any]:
     """Create a new scope with specified parent relationships."""
     namespace_name, scope_name = parse_canonical_scope_name(canonical_scope_name)
-    pool = await get_pool()
 
-    async with pool.acquire() as conn:
+    async with _acquire() as conn:
         async with conn.transaction():
-            ns_id = await conn.fetchval("SELECT id FROM namespaces WHERE name = $1", namespace_name)
-
-            if not ns_id:
-                raise ValueError(f"Namespace '{namespace_name}' not found")
-
-            await conn.execute(
+            # Resolve the namespace inside the insert; no row means the namespace does not exist
+            scope_id = await conn.fetchval(
                 """INSERT INTO scopes (namespace_id, name, description)
-                   VALUES ($1, $2, $3)""",
-                ns_id,
+                   SELECT id, $2, $3 FROM namespaces WHERE name = $1
+                   RETURNING id""",
+                namespace_name,
                 scope_name,
                 description,
             )
 
+            if not scope_id:
+                raise ValueError(f"Namespace '{namespace_name}' not found")
+
             # Add any additional parents using the database function
             final_parents = await conn.fetchval(
                 "SELECT add_scope_parents($1, $2)", canonical_scope_name, parents if parents else []
@@ -193,6 +277,7 @@ async def create_scope(canonical_scope_name: str, description: str, parents: lis
             return {"scope": canonical_scope_name, "description": description, "parents": final_parents or []}
 
 
+@_invalidates_namespaces_cache
 async def rename_scope(canonical_scope_name: str, new_scope_name: str) -> dict[str, Any]:
     """Rename a scope within the same namespace (references auto-updated)."""
     namespace_name, old_scope_name = parse_canonical_scope_name(canonical_scope_name)
@@ -200,66 +285,72 @@ async def rename_scope(canonical_scope_name: str, new_scope_name: str) -> dict[s
     if old_scope_name == "default":
         raise ValueError("Cannot rename default scope")
     
-    pool = await get_pool()
-
-    async with pool.acquire() as conn:
-        async with conn.transaction():
-            result = await conn.fetchrow(
-                """UPDATE scopes 
-                   SET name = $3, updated_at = NOW()
-                   FROM namespaces n
-                   WHERE scopes.namespace_id = n.id 
-                     AND n.name = $1 
-                     AND scopes.name = $2
-                   RETURNING scopes.description""",
-                namespace_name,
-                old_scope_name,
-                new_scope_name,
-            )
+    async with _acquire() as conn:
+        result = await conn.fetchrow(
+            """UPDATE scopes 
+               SET name = $3, updated_at = NOW()
+               FROM namespaces n
+               WHERE scopes.namespace_id = n.id 
+                 AND n.name = $1 
+                 AND scopes.name = $2
+               RETURNING scopes.description""",
+            namespace_name,
+            old_scope_name,
+            new_scope_name,
+        )
 
-            if not result:
-                raise ValueError(f"Scope '{canonical_scope_name}' not found")
+        if not result:
+            raise ValueError(f"Scope '{canonical_scope_name}' not found")
 
-            return {
-                "scope": f"{namespace_name}:{new_scope_name}",
-                "previous_name": canonical_scope_name,
-                "description": result["description"],
-            }
+        return {
+            "scope": f"{namespace_name}:{new_scope_name}",
+            "previous_name": canonical_scope_name,
+            "description": result["description"],
+        }
 
 
+@_invalidates_namespaces_cache
 async def update_scope_description(canonical_scope_name: str, new_description: str) -> dict[str, Any]:
     """Update scope description only."""
     if canonical_scope_name == "global:default":
         raise ValueError("Cannot modify the global:default scope description")
     
     namespace_name, scope_name = parse_canonical_scope_name(canonical_scope_name)
-    pool = await get_pool()
 
-    async with pool.acquire() as conn:
-        result = await conn.fetchrow(
-            """UPDATE scopes 
-               SET description = $3, updated_at = NOW()
-               FROM namespaces n
-               WHERE scopes.namespace_id = n.id 
-                 AND n.name = $1 
-                 AND scopes.name = $2
-               RETURNING scopes.name""",
+    async with _acquire() as conn:
+        # Skip the write (and updated_at bump) when the description is unchanged
+        scope_exists = await conn.fetchval(
+            """
+            WITH target AS (
+                SELECT s.id, s.description
+                FROM scopes s
+                JOIN namespaces n ON s.namespace_id = n.id
+                WHERE n.name = $1 AND s.name = $2
+            ),
+            updated AS (
+                UPDATE scopes 
+                SET description = $3, updated_at = NOW()
+                FROM target
+                WHERE scopes.id = target.id
+                  AND target.description IS DISTINCT FROM $3
+            )
+            SELECT EXISTS(SELECT 1 FROM target)
+        """,
             namespace_name,
             scope_name,
             new_description,
         )
 
-        if not result:
+        if not scope_exists:
             raise ValueError(f"Scope '{canonical_scope_name}' not found")
 
         return {"scope": canonical_scope_name, "description": new_description}
 
 
+@_invalidates_namespaces_cache
 async def add_scope_parents(canonical_scope_name: str, parent_canonical_scope_names: list[str]) -> dict[str, Any]:
     """Add parent relationships to an existing scope."""
-    pool = await get_pool()
-
-    async with pool.acquire() as conn:
+    async with _acquire() as conn:
         final_parents = await conn.fetchval(
             "SELECT add_scope_parents($1, $2)", canonical_scope_name, parent_canonical_scope_names
         )
@@ -274,11 +365,10 @@ async def add_scope_parents(canonical_scope_name: str, parent_canonical_scope_na
         }
 
 
+@_invalidates_namespaces_cache
 async def remove_scope_parents(canonical_scope_name: str, parent_canonical_scope_names: list[str]) -> dict[str, Any]:
     """Remove parent relationships from a scope."""
-    pool = await get_pool()
-
-    async with pool.acquire() as conn:
+    async with _acquire() as conn:
         remaining_parents = await conn.fetchval(
             "SELECT remove_scope_parents($1, $2)", canonical_scope_name, parent_canonical_scope_names
         )
@@ -305,45 +395,40 @@ async def remove_scope_parents(canonical_scope_name: str, parent_canonical_scope
         }
 
 
+@_invalidates_namespaces_cache
 async def delete_scope(canonical_scope_name: str) -> dict[str, Any]:
     """Delete scope and ALL associated knowledge (cannot delete default scopes)."""
     namespace_name, scope_name = parse_canonical_scope_name(canonical_scope_name)
-    pool = await get_pool()
 
-    async with pool.acquire() as conn:
-        async with conn.transaction():
-            if scope_name == "default":
-                raise ValueError("Cannot delete default scope")
+    if scope_name == "default":
+        raise ValueError("Cannot delete default scope")
 
-            stats = await conn.fetchrow(
-                """
-                SELECT COUNT(k.id) as knowledge_count
+    async with _acquire() as conn:
+        # Count and delete in a single statement; no row means the scope does not exist
+        stats = await conn.fetchrow(
+            """
+            WITH target AS (
+                SELECT s.id,
+                       (SELECT COUNT(*) FROM knowledge k WHERE k.scope_id = s.id) as knowledge_count
                 FROM scopes s
                 JOIN namespaces n ON s.namespace_id = n.id
-                LEFT JOIN knowledge k ON s.id = k.scope_id
                 WHERE n.name = $1 AND s.name = $2
-                GROUP BY s.id
-            """,
-                namespace_name,
-                scope_name,
+            ),
+            deleted AS (
+                DELETE FROM scopes WHERE id IN (SELECT id FROM target) RETURNING id
             )
+            SELECT target.knowledge_count
+            FROM target
+            JOIN deleted ON deleted.id = target.id
+        """,
+            namespace_name,
+            scope_name,
+        )
 
-            if not stats:
-                raise ValueError(f"Scope '{canonical_scope_name}' not found")
-
-            await conn.execute(
-                """
-                DELETE FROM scopes 
-                USING namespaces n
-                WHERE scopes.namespace_id = n.id 
-                  AND n.name = $1 
-                  AND scopes.name = $2
-            """,
-                namespace_name,
-                scope_name,
-            )
+        if not stats:
+            raise ValueError(f"Scope '{canonical_scope_name}' not found")
 
-            return {"scope": canonical_scope_name, "knowledge_deleted": stats["knowledge_count"] or 0}
+        return {"scope": canonical_scope_name, "knowledge_deleted": stats["knowledge_count"] or 0}
 
 
 # ============================================================================
@@ -356,9 +441,8 @@ async def write_knowledge(
 ) -> dict[str, Any]:
     """Store new knowledge entry with optional task size classification."""
     namespace_name, scope_name = parse_canonical_scope_name(canonical_scope_name)
-    pool = await get_pool()
 
-    async with pool.acquire() as conn:
+    async with _acquire() as conn:
         knowledge_id = await conn.fetchval(
             """
             INSERT INTO knowledge (scope_id, content, context, task_size)
@@ -383,19 +467,16 @@ async def write_knowledge(
 
 async def update_knowledge_content(knowledge_id: int, new_content: str) -> dict[str, Any]:
     """Update the content of an existing knowledge entry."""
-    pool = await get_pool()
-
-    async with pool.acquire() as conn:
-        result = await conn.fetchrow(
+    async with _acquire() as conn:
+        updated = await conn.execute(
             """UPDATE knowledge 
                SET content = $2, updated_at = NOW()
-               WHERE id = $1
-               RETURNING id""",
+               WHERE id = $1""",
             knowledge_id,
             new_content,
         )
 
-        if not result:
+        if updated == "UPDATE 0":
             raise ValueError(f"Knowledge entry {knowledge_id} not found")
 
         return {"id": knowledge_id}
@@ -403,19 +484,16 @@ async def update_knowledge_content(knowledge_id: int, new_content: str) -> dict[
 
 async def update_knowledge_context(knowledge_id: int, new_context: str) -> dict[str, Any]:
     """Update the context/summary of a knowledge entry."""
-    pool = await get_pool()
-
-    async with pool.acquire() as conn:
-        result = await conn.fetchrow(
+    async with _acquire() as conn:
+        updated = await conn.execute(
             """UPDATE knowledge 
                SET context = $2, updated_at = NOW()
-               WHERE id = $1
-               RETURNING id""",
+               WHERE id = $1""",
             knowledge_id,
             new_context,
         )
 
-        if not result:
+        if updated == "UPDATE 0":
             raise ValueError(f"Knowledge entry {knowledge_id} not found")
 
         return {"id": knowledge_id}
@@ -424,28 +502,34 @@ async def update_knowledge_context(knowledge_id: int, new_context: str) -> dict[
 async def move_knowledge_to_scope(knowledge_id: int, new_canonical_scope_name: str) -> dict[str, Any]:
     """Move knowledge entry to a different scope."""
     namespace_name, scope_name = parse_canonical_scope_name(new_canonical_scope_name)
-    pool = await get_pool()
 
-    async with pool.acquire() as conn:
+    async with _acquire() as conn:
+        # Resolve the target scope, update, and report which side is missing in a single round trip
         result = await conn.fetchrow(
             """
-            UPDATE knowledge 
-            SET scope_id = s.id, updated_at = NOW()
-            FROM scopes s
-            JOIN namespaces n ON s.namespace_id = n.id
-            WHERE knowledge.id = $1
-              AND n.name = $2 
-              AND s.name = $3
-            RETURNING knowledge.id
+            WITH target_scope AS (
+                SELECT s.id
+                FROM scopes s
+                JOIN namespaces n ON s.namespace_id = n.id
+                WHERE n.name = $2 AND s.name = $3
+            ),
+            moved AS (
+                UPDATE knowledge 
+                SET scope_id = target_scope.id, updated_at = NOW()
+                FROM target_scope
+                WHERE knowledge.id = $1
+                RETURNING knowledge.id
+            )
+            SELECT EXISTS(SELECT 1 FROM moved) as moved,
+                   EXISTS(SELECT 1 FROM knowledge WHERE id = $1) as knowledge_exists
         """,
             knowledge_id,
             namespace_name,
             scope_name,
         )
 
-        if not result:
-            knowledge_exists = await conn.fetchval("SELECT EXISTS(SELECT 1 FROM knowledge WHERE id = $1)", knowledge_id)
-            if not knowledge_exists:
+        if not result["moved"]:
+            if not result["knowledge_exists"]:
                 raise ValueError(f"Knowledge entry {knowledge_id} not found")
             else:
                 raise ValueError(f"Scope '{new_canonical_scope_name}' not found")
@@ -455,19 +539,16 @@ async def move_knowledge_to_scope(knowledge_id: int, new_canonical_scope_name: s
 
 async def update_knowledge_task_size(knowledge_id: int, new_task_size: str) -> dict[str, Any]:
     """Update task size classification for a knowledge entry."""
-    pool = await get_pool()
-
-    async with pool.acquire() as conn:
-        result = await conn.fetchrow(
+    async with _acquire() as conn:
+        updated = await conn.execute(
             """UPDATE knowledge 
                SET task_size = $2, updated_at = NOW()
-               WHERE id = $1
-               RETURNING id""",
+               WHERE id = $1""",
             knowledge_id,
             new_task_size,
         )
 
-        if not result:
+        if updated == "UPDATE 0":
             raise ValueError(f"Knowledge entry {knowledge_id} not found")
 
         return {"id": knowledge_id, "task_size": new_task_size}
@@ -475,9 +556,7 @@ async def update_knowledge_task_size(knowledge_id: int, new_task_size: str) -> d
 
 async def delete_knowledge(knowledge_id: int) -> dict[str, Any]:
     """Remove knowledge entry from the system (cannot be undone)."""
-    pool = await get_pool()
-
-    async with pool.acquire() as conn:
+    async with _acquire() as conn:
         deleted = await conn.execute("DELETE FROM knowledge WHERE id = $1", knowledge_id)
 
         if "DELETE 0" in deleted:
@@ -488,26 +567,36 @@ async def delete_knowledge(knowledge_id: int) -> dict[str, Any]:
 
 async def resolve_knowledge_conflict(active_knowledge_id: int, suppressed_knowledge_ids: list[int]) -> dict[str, Any]:
     """Mark knowledge entries for conflict resolution when contradictory information exists."""
-    pool = await get_pool()
-
-    async with pool.acquire() as conn:
-        async with conn.transaction():
-            all_ids = [active_knowledge_id] + suppressed_knowledge_ids
-            existing_ids = await conn.fetch("SELECT id FROM knowledge WHERE id = ANY($1)", all_ids)
-
-            if len(existing_ids) != len(all_ids):
-                found_ids = {row["id"] for row in existing_ids}
-                missing_ids = set(all_ids) - found_ids
-                raise ValueError(f"Knowledge entries not found: {missing_ids}")
-
-            await conn.execute(
-                """INSERT INTO knowledge_conflicts (active_knowledge_id, suppressed_knowledge_ids)
-                   VALUES ($1, $2)""",
-                active_knowledge_id,
-                suppressed_knowledge_ids,
+    # Drop repeated IDs in one pass, keeping the caller's order; an entry cannot suppress itself
+    suppressed_knowledge_ids = list(dict.fromkeys(suppressed_knowledge_ids))
+    if active_knowledge_id in suppressed_knowledge_ids:
+        raise ValueError("active_knowledge_id cannot also be in suppressed_knowledge_ids")
+
+    async with _acquire() as conn:
+        # Existence check and insert in one statement: the insert only happens when no IDs are missing
+        missing = await conn.fetchval(
+            """
+            WITH missing AS (
+                SELECT requested.id
+                FROM UNNEST($1::bigint || $2::bigint[]) AS requested(id)
+                WHERE NOT EXISTS (SELECT 1 FROM knowledge k WHERE k.id = requested.id)
+            ),
+            inserted AS (
+                INSERT INTO knowledge_conflicts (active_knowledge_id, suppressed_knowledge_ids)
+                SELECT $1, $2
+                WHERE NOT EXISTS (SELECT 1 FROM missing)
             )
+            SELECT ARRAY(SELECT id FROM missing)
+        """,
+            active_knowledge_id,
+            suppressed_knowledge_ids,
+        )
 
-            return {"active_id": active_knowledge_id, "suppressed_ids": suppressed_knowledge_ids}
+        if missing:
+            missing_ids = set(missing)
+            raise ValueError(f"Knowledge entries not found: {missing_ids}")
+
+        return {"active_id": active_knowledge_id, "suppressed_ids": suppressed_knowledge_ids}
 
 
 # ============================================================================
@@ -519,15 +608,19 @@ async def search_knowledge_base(
     queries: list[str], canonical_scope_name: str, task_size: str | None
 ) -> list[str]:
     """Search knowledge base using multiple queries within the scope hierarchy."""
-    pool = await get_pool()
-
-    async with pool.acquire() as conn:
-        rows = await conn.fetch(
-            "SELECT * FROM search_knowledge_base($1, $2, $3)", queries, canonical_scope_name, task_size
+    async with _acquire() as conn:
+        # Format as "ID: content" strings server-side, keeping the rank DESC order of the function output
+        results = await conn.fetchval(
+            """
+            SELECT array_agg(r.knowledge_id || ': ' || r.content ORDER BY r.ord)
+            FROM search_knowledge_base($1, $2, $3) WITH ORDINALITY AS r(knowledge_id, content, ord)
+        """,
+            queries,
+            canonical_scope_name,
+            task_size,
         )
 
-        # Format as "ID: content" strings, already sorted by rank DESC
-        return [f"{row['knowledge_id']}: {row['content']}" for row in rows]
+        return results or []
 
 
 # ============================================================================
@@ -537,22 +630,21 @@ async def search_knowledge_base(
 
 async def list_config() -> dict[str, Any]:
     """Get all configuration settings."""
-    pool = await get_pool()
-
-    async with pool.acquire() as conn:
+    async with _acquire() as conn:
         rows = await conn.fetch("""
             SELECT key, value, default_value, value_type, description
             FROM config
             ORDER BY key
         """)
 
+        # Records unpack positionally in SELECT column order, avoiding per-field name lookups
         result: dict[str, dict[str, Any]] = {"configs": {}}
-        for row in rows:
-            result["configs"][row["key"]] = {
-                "value": row["value"],
-                "default": row["default_value"],
-                "type": row["value_type"],
-                "description": row["description"],
+        for key, value, default_value, value_type, description in rows:
+            result["configs"][key] = {
+                "value": value,
+                "default": default_value,
+                "type": value_type,
+                "description": description,
             }
 
         return result
@@ -566,9 +658,7 @@ async def update_config(key: str, value: str) -> dict[str, Any]:
     if value is None:
         raise ValueError("Configuration value cannot be None")
     
-    pool = await get_pool()
-
-    async with pool.acquire() as conn:
+    async with _acquire() as conn:
         async with conn.transaction():
             # Get current config details
             config_row = await conn.fetchrow(
@@ -613,9 +703,7 @@ async def reset_config(key: str) -> dict[str, Any]:
     if not key or not key.strip():
         raise ValueError("Configuration key cannot be empty")
         
-    pool = await get_pool()
-
-    async with pool.acquire() as conn:
+    async with _acquire() as conn:
         async with conn.transaction():
             # Get the default value and reset
             config_row = await conn.fetchrow(
@@ -643,59 +731,60 @@ async def reset_config(key: str) -> dict[str, Any]:
 
 async def _get_namespaces_data(namespace_name: str | None = None) -> dict[str, Any]:
     """Internal function to get namespace data with optional filtering."""
-    pool = await get_pool()
+    cached = _namespaces_cache.get(namespace_name)
+    if cached is not None and time.monotonic() - cached[0] < NAMESPACES_CACHE_TTL:
+        rows = cached[1]
+    else:
+        rows = await _fetch_namespace_rows(namespace_name)
+
+    # Build a fresh result structure on every call so callers never share mutable state with the cache
+    namespaces: dict[str, dict[str, Any]] = {}
+    for ns_name, ns_description, scope_name, scope_description, parents in rows:
+        ns_data = namespaces.get(ns_name)
+        if ns_data is None:
+            ns_data = namespaces[ns_name] = {"description": ns_description, "scopes": {}}
+
+        if scope_name:
+            ns_data["scopes"][scope_name] = {"description": scope_description, "parents": list(parents)}
+
+    return {"namespaces": namespaces}
 
-    async with pool.acquire() as conn:
-        # Query 1: Get namespaces with scopes (single query handles both cases)
-        rows = await conn.fetch(
+
+async def _fetch_namespace_rows(namespace_name: str | None) -> tuple[_NamespaceRow, ...]:
+    """Query namespace rows and cache them, unless a mutation finished while querying."""
+    generation = _namespaces_cache_generation
+
+    async with _acquire() as conn:
+        # Namespaces, scopes, and aggregated parent lists in a single round trip
+        records = await conn.fetch(
             """
             SELECT n.name as namespace_name, n.description as namespace_description,
-                   s.name as scope_name, s.description as scope_description
+                   s.name as scope_name, s.description as scope_description,
+                   COALESCE(
+                       array_agg(pn.name || ':' || ps.name ORDER BY pn.name, ps.name) FILTER (WHERE ps.id IS NOT NULL),
+                       ARRAY[]::text[]
+                   ) as parents
             FROM namespaces n
             LEFT JOIN scopes s ON n.id = s.namespace_id
+            LEFT JOIN scope_parents sp ON sp.child_scope_id = s.id
+            LEFT JOIN scopes ps ON sp.parent_scope_id = ps.id
+            LEFT JOIN namespaces pn ON ps.namespace_id = pn.id
             WHERE $1::text IS NULL OR n.name = $1
+            GROUP BY n.id, s.id
             ORDER BY n.name, s.name
         """,
             namespace_name,
         )
 
-        if not rows:
-            return {"namespaces": {}}
-
-        # Query 2: Get parent relationships (single query handles both cases)
-        parents = await conn.fetch(
-            """
-            SELECT n.name || ':' || s.name as child_scope,
-                   pn.name || ':' || ps.name as parent_scope
-            FROM scope_parents sp
-            JOIN scopes s ON sp.child_scope_id = s.id
-            JOIN namespaces n ON s.namespace_id = n.id
-            JOIN scopes ps ON sp.parent_scope_id = ps.id
-            JOIN namespaces pn ON ps.namespace_id = pn.id
-            WHERE $1::text IS NULL OR n.name = $1
-        """,
-            namespace_name,
-        )
+    # Records unpack positionally in SELECT column order
+    rows = tuple(
+        (ns_name, ns_description, scope_name, scope_description, tuple(parents))
+        for ns_name, ns_description, scope_name, scope_description, parents in records
+    )
 
-        # Build parent lookup
-        parent_map: dict[str, list[str]] = {}
-        for p in parents:
-            if p["child_scope"] not in parent_map:
-                parent_map[p["child_scope"]] = []
-            parent_map[p["child_scope"]].append(p["parent_scope"])
-
-        # Build result structure
-        result: dict[str, dict[str, Any]] = {"namespaces": {}}
-        for row in rows:
-            ns_name = row["namespace_name"]
-            if ns_name not in result["namespaces"]:
-                result["namespaces"][ns_name] = {"description": row["namespace_description"], "scopes": {}}
-
-            if row["scope_name"]:
-                scope_key = f"{ns_name}:{row['scope_name']}"
-                result["namespaces"][ns_name]["scopes"][row["scope_name"]] = {
-                    "description": row["scope_description"],
-                    "parents": parent_map.get(scope_key, []),
-                }
+    if generation == _namespaces_cache_generation:
+        if len(_namespaces_cache) >= NAMESPACES_CACHE_MAX_ENTRIES:
+            _namespaces_cache.clear()
+        _namespaces_cache[namespace_name] = (time.monotonic(), rows)
 
-        return result
+    return rows
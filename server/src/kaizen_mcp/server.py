@@ -785,7 +785,7 @@ async def resolve_knowledge_conflict(
         result = await database.resolve_knowledge_conflict(active_knowledge_id, suppressed_knowledge_ids)
 
         await ctx.info(
-            f"Resolved conflict: {active_knowledge_id} active, {len(suppressed_knowledge_ids)} entries suppressed"
+            f"Resolved conflict: {active_knowledge_id} active, {len(result['suppressed_ids'])} entries suppressed"
         )
         return result
 
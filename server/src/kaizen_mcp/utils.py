@@ -1,5 +1,6 @@
 """Utility functions for Project Kaizen MCP Server."""
 
+from functools import lru_cache
 from typing import Literal, cast
 
 
@@ -23,10 +24,13 @@ def parse_transport(value: str | None, default: str = "stdio") -> Literal["stdio
     return cast(Literal["stdio", "http"], transport)
 
 
+@lru_cache(maxsize=1024)
 def parse_canonical_scope_name(canonical_scope_name: str) -> tuple[str, str]:
     """
     Parse canonical scope name into namespace name and scope name.
 
+    Results are cached since the same scopes are parsed by validators and database operations.
+
     Args:
         canonical_scope_name: Canonical scope name (namespace:scope)
 
@@ -19,18 +19,14 @@ MAX_CONTEXT_KEYWORDS = 20
 MAX_QUERIES_PER_SEARCH = 15
 MAX_KEYWORDS_PER_QUERY = 10
 
-# Regular expressions for validation
+# Regular expressions for validation, each compiled once at import
+_KEYWORD = rf"[a-z0-9\-]{{{MIN_KEYWORD_LENGTH},{MAX_KEYWORD_LENGTH}}}"
+
 NAMESPACE_PATTERN = re.compile(r"^[a-z0-9\-]+$")
-SCOPE_NAME_PATTERN = re.compile(r"^[a-z0-9\-]+$")
-KEYWORD_PATTERN = re.compile(rf"^[a-z0-9\-]{{{MIN_KEYWORD_LENGTH},{MAX_KEYWORD_LENGTH}}}$")
-CONTEXT_PATTERN = re.compile(
-    rf"^[a-z0-9\-]{{{MIN_KEYWORD_LENGTH},{MAX_KEYWORD_LENGTH}}}"
-    rf"( [a-z0-9\-]{{{MIN_KEYWORD_LENGTH},{MAX_KEYWORD_LENGTH}}}){{{0},{MAX_CONTEXT_KEYWORDS-1}}}$"
-)
-QUERY_PATTERN = re.compile(
-    rf"^[a-z0-9\-]{{{MIN_KEYWORD_LENGTH},{MAX_KEYWORD_LENGTH}}}"
-    rf"( [a-z0-9\-]{{{MIN_KEYWORD_LENGTH},{MAX_KEYWORD_LENGTH}}}){{{0},{MAX_KEYWORDS_PER_QUERY-1}}}$"
-)
+SCOPE_NAME_PATTERN = NAMESPACE_PATTERN
+KEYWORD_PATTERN = re.compile(rf"^{_KEYWORD}$")
+CONTEXT_PATTERN = re.compile(rf"^{_KEYWORD}( {_KEYWORD}){{0,{MAX_CONTEXT_KEYWORDS-1}}}$")
+QUERY_PATTERN = re.compile(rf"^{_KEYWORD}( {_KEYWORD}){{0,{MAX_KEYWORDS_PER_QUERY-1}}}$")
 
 # Valid enum values
 VALID_TASK_SIZES = {"XS", "S", "M", "L", "XL"}
@@ -46,7 +42,8 @@ def validate_namespace_name(namespace_name: str | None) -> None:
     if namespace_name is None or namespace_name == "":
         raise ValueError("Namespace name cannot be empty")
     
-    if not namespace_name.strip():
+    # Non-empty here, so isspace() matches "not strip()" without copying the string
+    if namespace_name.isspace():
         raise ValueError("Namespace name cannot be just whitespace")
 
     if len(namespace_name) < MIN_NAME_LENGTH or len(namespace_name) > MAX_NAME_LENGTH:
@@ -66,7 +63,7 @@ def validate_scope_name(scope_name: str | None) -> None:
     if scope_name is None or scope_name == "":
         raise ValueError("Scope name cannot be empty")
     
-    if not scope_name.strip():
+    if scope_name.isspace():
         raise ValueError("Scope name cannot be just whitespace")
 
     if len(scope_name) < MIN_NAME_LENGTH or len(scope_name) > MAX_NAME_LENGTH:
@@ -87,7 +84,7 @@ def validate_canonical_scope_name(canonical_scope_name: str | None) -> None:
     if canonical_scope_name is None or canonical_scope_name == "":
         raise ValueError("Canonical scope name cannot be empty")
     
-    if not canonical_scope_name.strip():
+    if canonical_scope_name.isspace():
         raise ValueError("Canonical scope name cannot be just whitespace")
 
     namespace_name, scope_name = parse_canonical_scope_name(canonical_scope_name.strip())
@@ -106,7 +103,7 @@ def validate_description(description: str | None) -> None:
     if description is None or description == "":
         raise ValueError("Description cannot be empty")
     
-    if not description.strip():
+    if description.isspace():
         raise ValueError("Description cannot be just whitespace")
 
     if len(description) < MIN_NAME_LENGTH or len(description) > MAX_NAME_LENGTH:
@@ -123,7 +120,7 @@ def validate_content(content: str | None) -> None:
     if content is None or content == "":
         raise ValueError("Knowledge content cannot be empty")
     
-    if not content.strip():
+    if content.isspace():
         raise ValueError("Knowledge content cannot be just whitespace")
 
 
@@ -138,10 +135,14 @@ def validate_context(context: str | None) -> None:
     if context is None or context == "":
         raise ValueError("Knowledge context cannot be empty")
     
-    if not context.strip():
+    if context.isspace():
         raise ValueError("Knowledge context cannot be just whitespace")
     
-    if not CONTEXT_PATTERN.match(context.strip()):
+    # Only copy the string when there is surrounding whitespace to remove
+    if context[0].isspace() or context[-1].isspace():
+        context = context.strip()
+
+    if not CONTEXT_PATTERN.match(context):
         raise ValueError(
             f"Knowledge context must be 1-{MAX_CONTEXT_KEYWORDS} space-separated keywords, "
             f"each {MIN_KEYWORD_LENGTH}-{MAX_KEYWORD_LENGTH} chars (lowercase letters/digits/hyphens only)"
@@ -162,14 +163,18 @@ def validate_query_terms(queries: list[str] | None) -> None:
     if len(queries) > MAX_QUERIES_PER_SEARCH:
         raise ValueError(f"Maximum {MAX_QUERIES_PER_SEARCH} search queries allowed")
     
+    match_query = QUERY_PATTERN.match
     for i, query in enumerate(queries):
         if query is None or query == "":
             raise ValueError(f"Query {i+1} cannot be empty")
         
-        if not query.strip():
+        if query.isspace():
             raise ValueError(f"Query {i+1} cannot be just whitespace")
         
-        if not QUERY_PATTERN.match(query.strip()):
+        if query[0].isspace() or query[-1].isspace():
+            query = query.strip()
+
+        if not match_query(query):
             raise ValueError(
                 f"Query {i+1} must be 1-{MAX_KEYWORDS_PER_QUERY} space-separated keywords, "
                 f"each {MIN_KEYWORD_LENGTH}-{MAX_KEYWORD_LENGTH} chars (lowercase letters/digits/hyphens only)"
@@ -190,7 +195,7 @@ def validate_task_size(task_size: str | None) -> None:
     if task_size == "":
         raise ValueError("Task size cannot be empty string")
     
-    if not task_size.strip():
+    if task_size.isspace():
         raise ValueError("Task size cannot be just whitespace")
 
     if task_size not in VALID_TASK_SIZES:
@@ -39,13 +39,23 @@ async def postgres_container() -> AsyncGenerator[PostgresContainer, None]:
         conn = await asyncpg.connect(get_db_url(container))
         db_dir = Path(__file__).parent.parent.parent / "database" / "sql"
         
-        await conn.execute((db_dir / "migrations" / "001_initial_schema.sql").read_text())
+        for migration in sorted((db_dir / "migrations").glob("*.sql")):
+            await conn.execute(migration.read_text())
         await conn.execute((db_dir / "tests" / "001_test_helpers.sql").read_text())
         
         await conn.close()
         yield container
 
 
+@pytest.fixture
+async def db_conn(postgres_container: PostgresContainer) -> AsyncGenerator[asyncpg.Connection, None]:
+    """Direct connection to the test database, starting from a clean state."""
+    conn = await asyncpg.connect(get_db_url(postgres_container))
+    await conn.execute("SELECT reset_test_database()")
+    yield conn
+    await conn.close()
+
+
 @pytest.fixture
 async def mcp_client(postgres_container: PostgresContainer) -> AsyncGenerator[Client[Any], None]:
     """MCP client with a clean database."""
@@ -0,0 +1,54 @@
+"""Tests for connection acquisition in the database module."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from kaizen_mcp import database
+
+
+class _FakePool:
+    """Pool stand-in whose acquire either times out or hands out a placeholder connection."""
+
+    def __init__(self, acquire_times_out: bool) -> None:
+        self.acquire_times_out = acquire_times_out
+        self.released: list[Any] = []
+
+    async def acquire(self, timeout: float | None = None) -> Any:
+        if self.acquire_times_out:
+            raise asyncio.TimeoutError
+        return object()
+
+    async def release(self, conn: Any) -> None:
+        self.released.append(conn)
+
+
+# ============================================================================
+# 1. Acquire Timeout Tests
+# ============================================================================
+
+async def test_acquire_timeout_raises_named_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Forces the pool acquire to time out.
+    Verifies the timeout surfaces as PoolExhaustedError with a readable message.
+    Value: Ensures tools report why a call failed instead of an empty TimeoutError."""
+    monkeypatch.setattr(database, "_pool", _FakePool(acquire_times_out=True))
+    monkeypatch.setattr(database, "_acquire_timeout", 0.5)
+
+    with pytest.raises(database.PoolExhaustedError) as exc_info:
+        async with database._acquire():
+            pass
+    assert str(exc_info.value) == "No database connection available within 0.5s"
+
+
+async def test_query_timeout_is_not_converted(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Raises a timeout while a connection is held.
+    Verifies it passes through unchanged and the connection is still released.
+    Value: Ensures only the acquire wait is reported as an acquire failure."""
+    pool = _FakePool(acquire_times_out=False)
+    monkeypatch.setattr(database, "_pool", pool)
+
+    with pytest.raises(asyncio.TimeoutError):
+        async with database._acquire():
+            raise asyncio.TimeoutError
+    assert len(pool.released) == 1
@@ -0,0 +1,64 @@
+"""Tests for the SQL run by the database maintenance scripts."""
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+import asyncpg
+
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "database" / "scripts"
+
+
+def _load_script(name: str) -> ModuleType:
+    """Load a database script as a module without running its main()."""
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / f"{name}.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# ============================================================================
+# 1. Data-Only Reset Tests
+# ============================================================================
+
+async def test_truncate_data_clears_discovered_tables(db_conn: asyncpg.Connection) -> None:
+    """Fills data tables, a table unknown to the script, and yoyo bookkeeping tables, then runs the reset SQL.
+    Verifies data is gone, initial data is restored, and config/yoyo tables are kept.
+    Value: Ensures reset.py --data-only covers tables added by later migrations."""
+    reset = _load_script("reset")
+
+    await db_conn.execute("""
+        INSERT INTO namespaces (name, description) VALUES ('extra-namespace', 'Namespace to be truncated');
+        INSERT INTO knowledge (scope_id, content, context)
+        SELECT s.id, 'Knowledge to be truncated', 'truncate test'
+        FROM scopes s JOIN namespaces n ON s.namespace_id = n.id
+        WHERE n.name = 'extra-namespace';
+        UPDATE config SET value = '7' WHERE key = 'search.max_results';
+
+        CREATE TABLE later_data (id INT);
+        INSERT INTO later_data VALUES (1);
+        CREATE TABLE _yoyo_log (id INT);
+        INSERT INTO _yoyo_log VALUES (1);
+        CREATE TABLE yoyo_lock (locked INT);
+        INSERT INTO yoyo_lock VALUES (1);
+    """)
+
+    try:
+        await db_conn.execute(reset.TRUNCATE_DATA_SQL)
+
+        namespaces = await db_conn.fetch("SELECT name FROM namespaces")
+        assert [row["name"] for row in namespaces] == ["global"]
+        assert await db_conn.fetchval(
+            "SELECT COUNT(*) FROM scopes s JOIN namespaces n ON s.namespace_id = n.id "
+            "WHERE n.name = 'global' AND s.name = 'default'"
+        ) == 1
+        assert await db_conn.fetchval("SELECT COUNT(*) FROM knowledge") == 0
+        assert await db_conn.fetchval("SELECT COUNT(*) FROM mv_active_knowledge_search") == 0
+        assert await db_conn.fetchval("SELECT COUNT(*) FROM later_data") == 0
+
+        assert await db_conn.fetchval("SELECT value FROM config WHERE key = 'search.max_results'") == "50"
+        assert await db_conn.fetchval("SELECT COUNT(*) FROM _yoyo_log") == 1
+        assert await db_conn.fetchval("SELECT COUNT(*) FROM yoyo_lock") == 1
+    finally:
+        await db_conn.execute("DROP TABLE IF EXISTS later_data, _yoyo_log, yoyo_lock")
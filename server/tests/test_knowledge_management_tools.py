@@ -636,6 +636,52 @@ async def test_resolve_knowledge_conflict_validation(mcp_client: Client[Any]) ->
         assert "suppressed_knowledge_ids cannot be empty" in str(exc_info.value)
 
 
+async def test_resolve_knowledge_conflict_duplicates_and_self_conflict(mcp_client: Client[Any]) -> None:
+    """Suppresses the same ID several times, then lists the active ID among the suppressed ones.
+    Verifies repeated IDs are recorded once and self-conflicts are rejected with a specific error.
+    Value: Ensures conflict input is normalized and an entry can never suppress itself."""
+    async with mcp_client as client:
+        result1 = await client.call_tool("write_knowledge", {
+            "canonical_scope_name": "global:default",
+            "content": "Knowledge kept active in duplicate test",
+            "context": "conflict duplicate active",
+            "optimized": True
+        })
+        
+        result2 = await client.call_tool("write_knowledge", {
+            "canonical_scope_name": "global:default",
+            "content": "Knowledge suppressed in duplicate test",
+            "context": "conflict duplicate suppressed",
+            "optimized": True
+        })
+        
+        active_id = result1.data["id"]
+        suppressed_id = result2.data["id"]
+        
+        # Repeated suppressed IDs are collapsed, keeping their order
+        resolve_result = await client.call_tool("resolve_knowledge_conflict", {
+            "active_knowledge_id": active_id,
+            "suppressed_knowledge_ids": [suppressed_id, suppressed_id, suppressed_id]
+        })
+        assert resolve_result.data["suppressed_ids"] == [suppressed_id]
+        
+        # Active ID listed among the suppressed IDs
+        with pytest.raises(ToolError) as exc_info:
+            await client.call_tool("resolve_knowledge_conflict", {
+                "active_knowledge_id": active_id,
+                "suppressed_knowledge_ids": [suppressed_id, active_id]
+            })
+        assert "active_knowledge_id cannot also be in suppressed_knowledge_ids" in str(exc_info.value)
+        
+        # The rejected self-conflict must not hide the active entry from search
+        search_result = await client.call_tool("search_knowledge_base", {
+            "queries": ["conflict duplicate active"],
+            "canonical_scope_name": "global:default",
+            "optimized": True
+        })
+        assert "Knowledge kept active in duplicate test" in search_result.data
+
+
 # ============================================================================
 # 6. Knowledge Deletion Tests
 # ============================================================================
@@ -317,6 +317,31 @@ async def test_update_namespace_description(mcp_client: Client[Any]) -> None:
         assert "update-test" in list_result.data["namespaces"]
 
 
+async def test_update_namespace_description_unchanged(mcp_client: Client[Any]) -> None:
+    """Updates a description to its current value, then updates a namespace that does not exist.
+    Value: Ensures skipped no-op writes still report the namespace as found, and missing ones as not found."""
+    async with mcp_client as client:
+        await client.call_tool("create_namespace", {
+            "namespace_name": "unchanged-test",
+            "description": "Same description"
+        })
+        
+        result = await client.call_tool("update_namespace_description", {
+            "namespace_name": "unchanged-test",
+            "new_description": "Same description"
+        })
+        
+        assert result.data["namespace"] == "unchanged-test"
+        assert result.data["description"] == "Same description"
+        
+        with pytest.raises(Exception) as exc_info:
+            await client.call_tool("update_namespace_description", {
+                "namespace_name": "missing-namespace",
+                "new_description": "Same description"
+            })
+        assert "not found" in str(exc_info.value).lower()
+
+
 # ============================================================================
 # 4. Integration Tests
 # ============================================================================
@@ -485,6 +510,45 @@ async def test_cross_namespace_dependency_cleanup(mcp_client: Client[Any]) -> No
         # (The exact behavior depends on implementation - scope remains, but the parent reference is cleaned up)
 
 
+async def test_namespace_listing_reflects_mutations(mcp_client: Client[Any]) -> None:
+    """Lists namespaces after each create, rename, scope change, and delete within one session.
+    Verifies listings never serve results cached before the mutation.
+    Value: Ensures the namespace listing cache is invalidated by every mutation."""
+    async with mcp_client as client:
+        list_result = await client.call_tool("list_namespaces", {})
+        assert _verify_namespace_absent(list_result.data, "cache-test")
+        
+        await client.call_tool("create_namespace", {
+            "namespace_name": "cache-test",
+            "description": "Namespace for cache invalidation"
+        })
+        list_result = await client.call_tool("list_namespaces", {})
+        assert _verify_namespace_exists(list_result.data, "cache-test")
+        
+        details_result = await client.call_tool("get_namespace_details", {"namespace_name": "cache-test"})
+        assert "cache-test:extra-scope" not in details_result.data["scopes"]
+        
+        await client.call_tool("create_scope", {
+            "canonical_scope_name": "cache-test:extra-scope",
+            "description": "Scope added after caching",
+            "parents": []
+        })
+        details_result = await client.call_tool("get_namespace_details", {"namespace_name": "cache-test"})
+        assert "cache-test:extra-scope" in details_result.data["scopes"]
+        
+        await client.call_tool("rename_namespace", {
+            "old_namespace_name": "cache-test",
+            "new_namespace_name": "cache-test-renamed"
+        })
+        list_result = await client.call_tool("list_namespaces", {})
+        assert _verify_namespace_absent(list_result.data, "cache-test")
+        assert _verify_namespace_exists(list_result.data, "cache-test-renamed")
+        
+        await client.call_tool("delete_namespace", {"namespace_name": "cache-test-renamed"})
+        list_result = await client.call_tool("list_namespaces", {})
+        assert _verify_namespace_absent(list_result.data, "cache-test-renamed")
+
+
 # ============================================================================
 # 5. Edge Case Tests
 # ============================================================================
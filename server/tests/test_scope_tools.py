@@ -433,6 +433,37 @@ async def test_update_scope_description(mcp_client: Client[Any]) -> None:
         assert result.data["description"] == "Updated description"
 
 
+async def test_update_scope_description_unchanged(mcp_client: Client[Any]) -> None:
+    """Updates a description to its current value, then updates a scope that does not exist.
+    Value: Ensures skipped no-op writes still report the scope as found, and missing ones as not found."""
+    async with mcp_client as client:
+        await client.call_tool("create_namespace", {
+            "namespace_name": "unchanged-test",
+            "description": "Namespace for unchanged update test"
+        })
+        
+        await client.call_tool("create_scope", {
+            "canonical_scope_name": "unchanged-test:my-scope",
+            "description": "Same description",
+            "parents": []
+        })
+        
+        result = await client.call_tool("update_scope_description", {
+            "canonical_scope_name": "unchanged-test:my-scope",
+            "new_description": "Same description"
+        })
+        
+        assert result.data["scope"] == "unchanged-test:my-scope"
+        assert result.data["description"] == "Same description"
+        
+        with pytest.raises(Exception) as exc_info:
+            await client.call_tool("update_scope_description", {
+                "canonical_scope_name": "unchanged-test:missing-scope",
+                "new_description": "Same description"
+            })
+        assert "not found" in str(exc_info.value).lower()
+
+
 async def test_update_scope_invalid_description(mcp_client: Client[Any]) -> None:
     """Tests description validation: empty, too short, too long, whitespace-only.
     Value: Validates input sanitization."""